@@ -33,12 +33,29 @@ class NLUMessageConverter(GraphComponent):
             Else empty list if user message is None.
         """
         if message:
-            data = {
-                TEXT: message.text,
-                "message_id": message.message_id,
-                "metadata": message.metadata,
-            }
-
-            return [Message(data=data)]
+            return [_message_from_user_message(message)]
 
         return []
+
+    @staticmethod
+    def convert_user_messages(messages: List[Optional[UserMessage]]) -> List[Message]:
+        """Converts multiple user messages into Message objects in one pass.
+
+        Args:
+            messages: The user messages to convert. `None` values are skipped.
+
+        Returns:
+            List containing a Message for every given user message.
+        """
+        return [_message_from_user_message(message) for message in messages if message]
+
+
+def _message_from_user_message(message: UserMessage) -> Message:
+    """Creates a Message from the text, id and metadata of a user message."""
+    data = {
+        TEXT: message.text,
+        "message_id": message.message_id,
+        "metadata": message.metadata,
+    }
+
+    return Message(data=data)
@@ -67,7 +67,7 @@ def module_path_from_instance(inst: Any) -> Text:
 
 def sort_list_of_dicts_by_first_key(dicts: List[Dict]) -> List[Dict]:
     """Sorts a list of dictionaries by their first key."""
-    return sorted(dicts, key=lambda d: list(d.keys())[0])
+    return sorted(dicts, key=lambda d: next(iter(d)))
 
 
 def lazy_property(function: Callable) -> Any:
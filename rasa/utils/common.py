@@ -1,7 +1,10 @@
 import asyncio
+import copy
 import logging
 import os
 import shutil
+import subprocess  # skipcq:BAN-B404
+import threading
 import warnings
 from pathlib import Path
 from types import TracebackType
@@ -9,9 +12,11 @@ from typing import (
     Any,
     Coroutine,
     Dict,
+    Iterable,
     List,
     Optional,
     Text,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -22,12 +27,55 @@ from typing import (
 import rasa.utils.io
 from rasa.constants import DEFAULT_LOG_LEVEL_LIBRARIES, ENV_LOG_LEVEL_LIBRARIES
 from rasa.shared.constants import DEFAULT_LOG_LEVEL, ENV_LOG_LEVEL
+import rasa.shared.utils.common
 import rasa.shared.utils.io
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+LOG_LEVELS_BY_NAME = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+APSCHEDULER_LOGGERS = (
+    "apscheduler",
+    "apscheduler.scheduler",
+    "apscheduler.executors",
+    "apscheduler.executors.default",
+)
+SOCKETIO_LOGGERS = ("websockets.protocol", "engineio.server", "socketio.server")
+TENSORFLOW_LOGGERS = ("tensorflow",)
+ASYNCIO_LOGGERS = ("asyncio",)
+MATPLOTLIB_LOGGERS = (
+    "matplotlib.backends.backend_pdf",
+    "matplotlib.colorbar",
+    "matplotlib.font_manager",
+    "matplotlib.ticker",
+)
+# Library loggers which don't propagate their records to the root logger
+NON_PROPAGATING_LIBRARY_LOGGERS = (
+    APSCHEDULER_LOGGERS + SOCKETIO_LOGGERS + TENSORFLOW_LOGGERS
+)
+
+# Loggers by name which were looked up by `_get_logger`
+_loggers_by_name: Dict[Text, logging.Logger] = {}
+
+# Parsed global configurations by path, together with the modification time and
+# size of the file when it was parsed
+_global_config_cache: Dict[Text, Tuple[Tuple[int, int], Dict[Text, Any]]] = {}
+_global_config_cache_lock = threading.Lock()
+
+# Number of entries above which temporary directories are removed with `rm -rf`
+LARGE_DIRECTORY_ENTRY_THRESHOLD = 1000
+
 
 class TempDirectoryPath(str, ContextManager):
     """Represents a path to an temporary directory.
@@ -44,13 +92,66 @@ class TempDirectoryPath(str, ContextManager):
         _value: Optional[Exception],
         _tb: Optional[TracebackType],
     ) -> None:
-        if os.path.exists(self):
-            shutil.rmtree(self)
+        if not os.path.exists(self):
+            return
+
+        if os.name == "posix" and _has_more_entries_than(
+            self, LARGE_DIRECTORY_ENTRY_THRESHOLD
+        ):
+            # `rm -rf` is a lot faster than `shutil.rmtree` for large directory trees
+            try:
+                subprocess.run(  # skipcq:BAN-B607,BAN-B603
+                    ["rm", "-rf", "--", str(self)], stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                pass
+            if not os.path.exists(self):
+                return
+
+        shutil.rmtree(self)
+
+
+def _has_more_entries_than(path: Text, threshold: int) -> bool:
+    """Checks whether a directory tree contains more than `threshold` entries.
+
+    Args:
+        path: The directory to check.
+        threshold: The number of entries to compare with.
+
+    Returns:
+        `True` if the directory tree contains more than `threshold` entries.
+    """
+    count = 0
+    directories = [path]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                count += 1
+                if count > threshold:
+                    return True
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+    return False
 
 
 def read_global_config(path: Text) -> Dict[Text, Any]:
     """Read global Rasa configuration.
 
+    Args:
+        path: Path to the configuration
+    Returns:
+        The global configuration
+    """
+    # callers may modify the returned configuration
+    return copy.deepcopy(_read_cached_global_config(path))
+
+
+def _read_cached_global_config(path: Text) -> Dict[Text, Any]:
+    """Reads the global configuration, re-using the last parse if it's up to date.
+
+    The file is only parsed again if its modification time or size changed since it
+    was last read. The returned configuration must not be modified.
+
     Args:
         path: Path to the configuration
     Returns:
@@ -58,71 +159,151 @@ def read_global_config(path: Text) -> Dict[Text, Any]:
     """
     # noinspection PyBroadException
     try:
-        return rasa.shared.utils.io.read_config_file(path)
+        stat = os.stat(path)
+        file_state = (stat.st_mtime_ns, stat.st_size)
+        cached = _global_config_cache.get(path)
+        if cached is not None and cached[0] == file_state:
+            return cached[1]
+
+        config = rasa.shared.utils.io.read_config_file(path)
+        with _global_config_cache_lock:
+            _global_config_cache[path] = (file_state, config)
+        return config
     except Exception:
         # if things go south we pretend there is no config
         return {}
 
 
+def _invalidate_global_config_cache(path: Text) -> None:
+    with _global_config_cache_lock:
+        _global_config_cache.pop(path, None)
+
+
 def set_log_level(log_level: Optional[int] = None) -> None:
     """Set log level of Rasa and Tensorflow either to the provided log level or
     to the log level specified in the environment variable 'LOG_LEVEL'. If none is set
     a default log level will be used."""
 
     if not log_level:
-        log_level = os.environ.get(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
-        log_level = logging.getLevelName(log_level)
+        log_level_name = os.environ.get(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
+        # unknown names are passed on as they are and rejected by the logger
+        log_level = LOG_LEVELS_BY_NAME.get(log_level_name, log_level_name)
+    else:
+        log_level_name = logging.getLevelName(log_level)
+
+    _disable_tensorflow_cpp_logs()
+    library_log_level = _library_log_level()
+    _configure_loggers(
+        {
+            "rasa": {"level": log_level},
+            **_library_loggers_config(
+                library_log_level, NON_PROPAGATING_LIBRARY_LOGGERS, propagate=False
+            ),
+            **_library_loggers_config(
+                library_log_level, ASYNCIO_LOGGERS + MATPLOTLIB_LOGGERS
+            ),
+        }
+    )
+
+    os.environ[ENV_LOG_LEVEL] = log_level_name
+
+
+def _library_log_level() -> Text:
+    """Returns the log level specified in the env variable 'LOG_LEVEL_LIBRARIES'."""
+    return (
+        os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
+        or DEFAULT_LOG_LEVEL_LIBRARIES
+    )
+
+
+def _library_loggers_config(
+    log_level: Union[int, Text], logger_names: Iterable[Text], propagate: bool = True
+) -> Dict[Text, Dict[Text, Any]]:
+    """Creates the configuration for library loggers.
 
-    logging.getLogger("rasa").setLevel(log_level)
+    Args:
+        log_level: The log level which should be used for the loggers.
+        logger_names: Names of the library loggers.
+        propagate: If `False`, the loggers stop propagating their records to the
+            handlers of their ancestors.
 
-    update_tensorflow_log_level()
-    update_asyncio_log_level()
-    update_matplotlib_log_level()
-    update_apscheduler_log_level()
-    update_socketio_log_level()
+    Returns:
+        The configuration of each logger by logger name.
+    """
+    logger_config: Dict[Text, Any] = {"level": log_level}
+    if not propagate:
+        logger_config["propagate"] = False
+    return {logger_name: logger_config for logger_name in logger_names}
 
-    os.environ[ENV_LOG_LEVEL] = logging.getLevelName(log_level)
 
+def _apply_library_log_level(
+    log_level: Union[int, Text], logger_names: Iterable[Text], propagate: bool = True
+) -> None:
+    """Sets the log level of library loggers.
 
-def update_apscheduler_log_level() -> None:
-    log_level = os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
+    Args:
+        log_level: The log level which should be used for the loggers.
+        logger_names: Names of the library loggers.
+        propagate: If `False`, the loggers stop propagating their records to the
+            handlers of their ancestors.
+    """
+    _configure_loggers(_library_loggers_config(log_level, logger_names, propagate))
 
-    apscheduler_loggers = [
-        "apscheduler",
-        "apscheduler.scheduler",
-        "apscheduler.executors",
-        "apscheduler.executors.default",
-    ]
 
-    for logger_name in apscheduler_loggers:
-        logging.getLogger(logger_name).setLevel(log_level)
-        logging.getLogger(logger_name).propagate = False
+def _configure_loggers(loggers_config: Dict[Text, Dict[Text, Any]]) -> None:
+    """Sets level and propagation of multiple loggers at once.
 
+    Only attributes which differ from the configuration are set, so that
+    reconfiguring logging doesn't needlessly reset the caches of the loggers.
 
-def update_socketio_log_level() -> None:
-    log_level = os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
+    Args:
+        loggers_config: The configuration of each logger by logger name.
+    """
+    for logger_name, logger_config in loggers_config.items():
+        logger_to_configure = _get_logger(logger_name)
 
-    socketio_loggers = ["websockets.protocol", "engineio.server", "socketio.server"]
+        level = logger_config["level"]
+        if isinstance(level, str):
+            level = LOG_LEVELS_BY_NAME.get(level, level)
+        if logger_to_configure.level != level:
+            logger_to_configure.setLevel(level)
 
-    for logger_name in socketio_loggers:
-        logging.getLogger(logger_name).setLevel(log_level)
-        logging.getLogger(logger_name).propagate = False
+        propagate = logger_config.get("propagate")
+        if propagate is not None and logger_to_configure.propagate != propagate:
+            logger_to_configure.propagate = propagate
 
 
-def update_tensorflow_log_level() -> None:
-    """Sets Tensorflow log level based on env variable 'LOG_LEVEL_LIBRARIES'."""
+def _get_logger(name: Text) -> logging.Logger:
+    """Returns the logger with the given name.
+
+    Loggers are never replaced once created, so they are kept after the first lookup
+    to skip the locked lookup of `logging.getLogger` on later calls.
+    """
+    existing_logger = _loggers_by_name.get(name)
+    if existing_logger is None:
+        existing_logger = _loggers_by_name[name] = logging.getLogger(name)
+    return existing_logger
+
+
+def _disable_tensorflow_cpp_logs() -> None:
     # Disables libvinfer, tensorRT, cuda, AVX2 and FMA warnings (CPU support).
     # This variable needs to be set before the
     # first import since some warnings are raised on the first import.
     os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"
 
-    log_level = os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
 
-    if not log_level:
-        log_level = "ERROR"
+def update_apscheduler_log_level() -> None:
+    _apply_library_log_level(_library_log_level(), APSCHEDULER_LOGGERS, propagate=False)
+
+
+def update_socketio_log_level() -> None:
+    _apply_library_log_level(_library_log_level(), SOCKETIO_LOGGERS, propagate=False)
+
 
-    logging.getLogger("tensorflow").setLevel(log_level)
-    logging.getLogger("tensorflow").propagate = False
+def update_tensorflow_log_level() -> None:
+    """Sets Tensorflow log level based on env variable 'LOG_LEVEL_LIBRARIES'."""
+    _disable_tensorflow_cpp_logs()
+    _apply_library_log_level(_library_log_level(), TENSORFLOW_LOGGERS, propagate=False)
 
 
 def update_sanic_log_level(log_file: Optional[Text] = None) -> None:
@@ -130,15 +311,11 @@ def update_sanic_log_level(log_file: Optional[Text] = None) -> None:
     variable 'LOG_LEVEL_LIBRARIES'."""
     from sanic.log import logger, error_logger, access_logger
 
-    log_level = os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
-
-    logger.setLevel(log_level)
-    error_logger.setLevel(log_level)
-    access_logger.setLevel(log_level)
-
-    logger.propagate = False
-    error_logger.propagate = False
-    access_logger.propagate = False
+    _apply_library_log_level(
+        _library_log_level(),
+        (logger.name, error_logger.name, access_logger.name),
+        propagate=False,
+    )
 
     if log_file is not None:
         formatter = logging.Formatter("%(asctime)s [%(levelname)-5.5s]  %(message)s")
@@ -153,18 +330,13 @@ def update_sanic_log_level(log_file: Optional[Text] = None) -> None:
 def update_asyncio_log_level() -> None:
     """Set the log level of asyncio to the log level specified in the environment
     variable 'LOG_LEVEL_LIBRARIES'."""
-    log_level = os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
-    logging.getLogger("asyncio").setLevel(log_level)
+    _apply_library_log_level(_library_log_level(), ASYNCIO_LOGGERS)
 
 
 def update_matplotlib_log_level() -> None:
     """Set the log level of matplotlib to the log level specified in the environment
     variable 'LOG_LEVEL_LIBRARIES'."""
-    log_level = os.environ.get(ENV_LOG_LEVEL_LIBRARIES, DEFAULT_LOG_LEVEL_LIBRARIES)
-    logging.getLogger("matplotlib.backends.backend_pdf").setLevel(log_level)
-    logging.getLogger("matplotlib.colorbar").setLevel(log_level)
-    logging.getLogger("matplotlib.font_manager").setLevel(log_level)
-    logging.getLogger("matplotlib.ticker").setLevel(log_level)
+    _apply_library_log_level(_library_log_level(), MATPLOTLIB_LOGGERS)
 
 
 def set_log_and_warnings_filters() -> None:
@@ -181,7 +353,7 @@ def set_log_and_warnings_filters() -> None:
 
 def sort_list_of_dicts_by_first_key(dicts: List[Dict]) -> List[Dict]:
     """Sorts a list of dictionaries by their first key."""
-    return sorted(dicts, key=lambda d: list(d.keys())[0])
+    return rasa.shared.utils.common.sort_list_of_dicts_by_first_key(dicts)
 
 
 def write_global_config_value(name: Text, value: Any) -> bool:
@@ -203,6 +375,7 @@ def write_global_config_value(name: Text, value: Any) -> bool:
         c = read_global_config(config_path)
         c[name] = value
         rasa.shared.utils.io.write_yaml(c, rasa.constants.GLOBAL_USER_CONFIG_PATH)
+        _invalidate_global_config_cache(config_path)
         return True
     except Exception as e:
         logger.warning(f"Failed to write global config. Error: {e}. Skipping.")
@@ -222,13 +395,11 @@ def read_global_config_value(name: Text, unavailable_ok: bool = True) -> Any:
     # in tests
     config_path = rasa.constants.GLOBAL_USER_CONFIG_PATH
 
-    if not os.path.exists(config_path):
-        return not_found()
-
-    c = read_global_config(config_path)
+    # only the requested value is copied, so probing for missing keys is cheap
+    c = _read_cached_global_config(config_path)
 
     if name in c:
-        return c[name]
+        return copy.deepcopy(c[name])
     else:
         return not_found()
 
@@ -242,12 +413,24 @@ def update_existing_keys(
     be ignored."""
 
     updated = original.copy()
-    for k, v in updates.items():
-        if k in updated:
-            updated[k] = v
+    update_existing_keys_inplace(updated, updates)
     return updated
 
 
+def update_existing_keys_inplace(
+    original: Dict[Any, Any], updates: Dict[Any, Any]
+) -> None:
+    """Updates the values of keys in `original` which are also present in `updates`.
+
+    Unlike `update_existing_keys` this modifies `original` instead of copying it.
+    If the updates contain a key that is not present in the original dict, it will
+    be ignored.
+    """
+    for k, v in updates.items():
+        if k in original:
+            original[k] = v
+
+
 class RepeatedLogFilter(logging.Filter):
     """Filter repeated log records."""
 
@@ -255,17 +438,28 @@ class RepeatedLogFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Determines whether current log is different to last log."""
-        current_log = (
+        # Compare the cheap attributes first and only compare the (arbitrary)
+        # arguments if everything else matches. This avoids building a tuple for
+        # every record.
+        last_log = self.last_log
+        if (
+            last_log is not None
+            and record.lineno == last_log[2]
+            and record.levelno == last_log[0]
+            and record.pathname == last_log[1]
+            and (record.msg is last_log[3] or record.msg == last_log[3])
+            and (record.args is last_log[4] or record.args == last_log[4])
+        ):
+            return False
+
+        self.last_log = (
             record.levelno,
             record.pathname,
             record.lineno,
             record.msg,
             record.args,
         )
-        if current_log != self.last_log:
-            self.last_log = current_log
-            return True
-        return False
+        return True
 
 
 def run_in_loop(
@@ -300,7 +494,8 @@ def run_in_loop(
 
     # Let's also finish all running tasks:
     pending = asyncio.all_tasks(loop)
-    loop.run_until_complete(asyncio.gather(*pending))
+    if pending:
+        loop.run_until_complete(asyncio.gather(*pending))
 
     return result
 
@@ -335,13 +530,24 @@ def directory_size_in_mb(
     Returns:
         Directory size in MiB.
     """
-    filenames_to_exclude = filenames_to_exclude or []
+    filenames_to_exclude = set(filenames_to_exclude or [])
     size = 0.0
-    for root, _dirs, files in os.walk(path):
-        for filename in files:
-            if filename in filenames_to_exclude:
-                continue
-            size += (Path(root) / filename).stat().st_size
+    directories = [path]
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except OSError:
+            # like `os.walk` skip directories which can't be scanned (e.g. because
+            # they were removed in the meantime)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # like `os.walk` don't descend into symlinked directories
+                    if not entry.is_symlink():
+                        directories.append(entry.path)
+                elif entry.name not in filenames_to_exclude:
+                    size += entry.stat().st_size
 
     # bytes to MiB
     return size / 1_048_576
@@ -351,9 +557,9 @@ def copy_directory(source: Path, destination: Path) -> None:
     """Copies the content of one directory into another.
 
     Unlike `shutil.copytree` this doesn't raise if `destination` already exists.
-
-    # TODO: Drop this in favor of `shutil.copytree(..., dirs_exist_ok=True)` when
-    # dropping Python 3.7.
+    Only the children of `source` are copied, so that the permissions of
+    `destination` itself are left untouched (`shutil.copytree(...,
+    dirs_exist_ok=True)` would copy them from `source`).
 
     Args:
         source: The directory whose contents should be copied to `destination`.
@@ -365,7 +571,7 @@ def copy_directory(source: Path, destination: Path) -> None:
     if not destination.exists():
         destination.mkdir(parents=True)
 
-    if list(destination.glob("*")):
+    if any(destination.iterdir()):
         raise ValueError(
             f"Destination path '{destination}' is not empty. Directories "
             f"can only be copied to empty directories."
@@ -1,25 +1,33 @@
-from typing import Text
-from hashlib import md5, sha1
+from typing import Optional, Text, Type, TYPE_CHECKING
+from hashlib import blake2b, sha1
 
 import logging
+import mmap
+import os
+
+if TYPE_CHECKING:
+    from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+        YAMLStoryReader,
+    )
 
 logger = logging.getLogger(__name__)
 
+# files smaller than this are read at once since mapping them isn't worth it
+FILE_HASH_MMAP_THRESHOLD = 256 * 1024
+
+# imported lazily by `_yaml_story_reader`
+_YAMLStoryReader: Optional[Type["YAMLStoryReader"]] = None
+
 
 def get_latest_parse_data_language(all_events):
-    events = reversed(all_events)
-    try:
-        while True:
-            event = next(events)
-            if (
-                event["event"] == "user"
-                and "parse_data" in event
-                and "language" in event["parse_data"]
-            ):
-                return event["parse_data"]["language"]
-
-    except StopIteration:
-        return None
+    for event in reversed(all_events):
+        if event.get("event") != "user":
+            continue
+        parse_data = event.get("parse_data")
+        if parse_data and "language" in parse_data:
+            return parse_data["language"]
+
+    return None
 
 def is_story_file(file_path: Text) -> bool:
     """Checks if a file is a Rasa story file.
@@ -30,19 +38,48 @@ def is_story_file(file_path: Text) -> bool:
     Returns:
         `True` if it's a story file, otherwise `False`.
     """
-    from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
-        YAMLStoryReader,
-    )
+    return _yaml_story_reader().is_stories_file(file_path)
+
+
+def _yaml_story_reader() -> Type["YAMLStoryReader"]:
+    """Returns the `YAMLStoryReader` class, importing it on the first call only."""
+    global _YAMLStoryReader
+    if _YAMLStoryReader is None:
+        from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+            YAMLStoryReader,
+        )
+
+        _YAMLStoryReader = YAMLStoryReader
+    return _YAMLStoryReader
 
-    return YAMLStoryReader.is_stories_file(
-        file_path
-    )
 
 def get_file_hash(path: Text) -> Text:
-    """Calculate the md5 hash of a file."""
-    return md5(file_as_bytes(path)).hexdigest()  # nosec
+    """Calculate the hash of a file.
+
+    BLAKE2b is used since the hash only identifies file contents and it is
+    considerably faster than md5. The 16 byte digest keeps the hash the same length
+    as an md5 hash.
+
+    Large files are memory mapped and hashed without copying their content into a
+    bytes object first.
+    """
+    file_hash = blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < FILE_HASH_MMAP_THRESHOLD:
+            file_hash.update(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                if hasattr(mapped_file, "madvise") and hasattr(
+                    mmap, "MADV_SEQUENTIAL"
+                ):
+                    mapped_file.madvise(mmap.MADV_SEQUENTIAL)
+                file_hash.update(mapped_file)
+    return file_hash.hexdigest()
 
 def file_as_bytes(path: Text) -> bytes:
-    """Read in a file as a byte array."""
+    """Read in a file as a byte array.
+
+    Use `get_file_hash` to hash files instead of reading them with this function.
+    """
     with open(path, "rb") as f:
         return f.read()
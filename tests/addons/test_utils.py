@@ -0,0 +1,49 @@
+from hashlib import blake2b
+from pathlib import Path
+
+import pytest
+
+import rasa_addons.utils as addons_utils
+
+
+@pytest.mark.parametrize(
+    "size",
+    [
+        0,
+        addons_utils.FILE_HASH_MMAP_THRESHOLD - 1,
+        addons_utils.FILE_HASH_MMAP_THRESHOLD,
+        addons_utils.FILE_HASH_MMAP_THRESHOLD + 1,
+    ],
+)
+def test_get_file_hash(tmp_path: Path, size: int):
+    content = bytes(i % 256 for i in range(size))
+    file_path = tmp_path / "stories.yml"
+    file_path.write_bytes(content)
+
+    assert (
+        addons_utils.get_file_hash(str(file_path))
+        == blake2b(content, digest_size=16).hexdigest()
+    )
+
+
+def test_get_latest_parse_data_language():
+    events = [
+        {"event": "user", "parse_data": {"language": "en"}},
+        {"event": "user", "parse_data": {"language": "fr"}},
+        {"event": "bot", "parse_data": {"language": "de"}},
+        {"event": "user", "parse_data": None},
+        {"event": "user"},
+        {"parse_data": {"language": "es"}},
+    ]
+
+    assert addons_utils.get_latest_parse_data_language(events) == "fr"
+
+
+def test_get_latest_parse_data_language_without_language():
+    events = [
+        {"event": "user", "parse_data": {"intent": {}}},
+        {"event": "bot"},
+        {"event": "user", "parse_data": None},
+    ]
+
+    assert addons_utils.get_latest_parse_data_language(events) is None
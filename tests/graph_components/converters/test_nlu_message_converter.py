@@ -0,0 +1,22 @@
+from rasa.core.channels.channel import UserMessage
+from rasa.graph_components.converters.nlu_message_converter import NLUMessageConverter
+from rasa.shared.nlu.constants import TEXT
+
+
+def test_convert_user_messages():
+    messages = [
+        UserMessage(text="Hello", message_id="1", metadata={"a": 1}),
+        None,
+        UserMessage(text="Bye", message_id="2", metadata={"b": 2}),
+    ]
+
+    converted = NLUMessageConverter.convert_user_messages(messages)
+
+    assert [message.data for message in converted] == [
+        {TEXT: "Hello", "message_id": "1", "metadata": {"a": 1}},
+        {TEXT: "Bye", "message_id": "2", "metadata": {"b": 2}},
+    ]
+
+
+def test_convert_user_message_without_message():
+    assert NLUMessageConverter.convert_user_message(None) == []
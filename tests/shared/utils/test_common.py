@@ -32,6 +32,20 @@ def test_sort_dicts_by_keys():
     assert actual == expected
 
 
+def test_sort_dicts_by_keys_with_multiple_keys():
+    test_data = [{"Z": 1, "A": 2}, {"B": 10, "Y": 3}]
+
+    expected = [{"B": 10, "Y": 3}, {"Z": 1, "A": 2}]
+    actual = rasa.shared.utils.common.sort_list_of_dicts_by_first_key(test_data)
+
+    assert actual == expected
+
+
+def test_sort_dicts_by_keys_with_empty_dict():
+    with pytest.raises(StopIteration):
+        rasa.shared.utils.common.sort_list_of_dicts_by_first_key([{"A": 1}, {}])
+
+
 @pytest.mark.parametrize(
     "collection, possible_outputs",
     [
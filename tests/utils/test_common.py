@@ -1,7 +1,17 @@
+import asyncio
 import logging
-from typing import Any
+import os
+from pathlib import Path
+from typing import Any, Generator
+from unittest.mock import Mock
 
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.constants
+import rasa.shared.utils.io
 import rasa.utils.common
+from rasa.shared.constants import ENV_LOG_LEVEL
 from rasa.utils.common import RepeatedLogFilter
 
 
@@ -46,3 +56,225 @@ async def test_call_maybe_coroutine_with_sync() -> Any:
     actual = await rasa.utils.common.call_potential_coroutine(my_function())
 
     assert actual == expected
+
+
+def test_directory_size_in_mb(tmp_path: Path):
+    sub_directory = tmp_path / "sub"
+    sub_directory.mkdir()
+    (sub_directory / "file").write_bytes(b"a" * 1_048_576)
+    (tmp_path / "other_file").write_bytes(b"a" * 524_288)
+    (tmp_path / "excluded").write_bytes(b"a" * 1_048_576)
+
+    assert rasa.utils.common.directory_size_in_mb(
+        tmp_path, filenames_to_exclude=["excluded"]
+    ) == pytest.approx(1.5)
+
+
+def test_directory_size_in_mb_of_missing_directory(tmp_path: Path):
+    assert rasa.utils.common.directory_size_in_mb(tmp_path / "missing") == 0.0
+
+
+def test_directory_size_in_mb_skips_removed_sub_directory(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    removed_directory = tmp_path / "removed"
+    removed_directory.mkdir()
+    (removed_directory / "file").write_bytes(b"a" * 1_048_576)
+    (tmp_path / "other_file").write_bytes(b"a" * 524_288)
+
+    scandir = os.scandir
+
+    def scandir_with_concurrent_removal(path: Any) -> Any:
+        # simulate the directory being removed after its parent was listed
+        if path == str(removed_directory):
+            (removed_directory / "file").unlink()
+            removed_directory.rmdir()
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir_with_concurrent_removal)
+
+    assert rasa.utils.common.directory_size_in_mb(tmp_path) == pytest.approx(0.5)
+
+
+def test_copy_directory(tmp_path: Path):
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "file").write_text("content")
+    (source / "top_level_file").write_text("other content")
+
+    destination = tmp_path / "destination"
+    destination.mkdir()
+
+    rasa.utils.common.copy_directory(source, destination)
+
+    assert (destination / "sub" / "file").read_text() == "content"
+    assert (destination / "top_level_file").read_text() == "other content"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="File modes are POSIX specific.")
+def test_copy_directory_keeps_destination_mode(tmp_path: Path):
+    source = tmp_path / "source"
+    source.mkdir(mode=0o700)
+    (source / "file").write_text("content")
+    destination = tmp_path / "destination"
+    destination.mkdir()
+    destination.chmod(0o755)
+
+    rasa.utils.common.copy_directory(source, destination)
+
+    assert (destination / "file").read_text() == "content"
+    assert destination.stat().st_mode & 0o777 == 0o755
+
+
+def test_copy_directory_to_non_empty_directory(tmp_path: Path):
+    source = tmp_path / "source"
+    source.mkdir()
+    destination = tmp_path / "destination"
+    destination.mkdir()
+    (destination / "file").write_text("content")
+
+    with pytest.raises(ValueError):
+        rasa.utils.common.copy_directory(source, destination)
+
+
+@pytest.mark.parametrize(
+    "number_of_files", [1, rasa.utils.common.LARGE_DIRECTORY_ENTRY_THRESHOLD + 1]
+)
+def test_temp_directory_path_removes_directory(tmp_path: Path, number_of_files: int):
+    directory = tmp_path / "temp"
+    (directory / "sub").mkdir(parents=True)
+    for i in range(number_of_files):
+        (directory / "sub" / f"file_{i}").write_text("content")
+
+    with rasa.utils.common.TempDirectoryPath(str(directory)):
+        pass
+
+    assert not directory.exists()
+
+
+def test_update_existing_keys():
+    original = {"a": 1, "b": 2}
+
+    updated = rasa.utils.common.update_existing_keys(original, {"a": 3, "c": 4})
+
+    assert updated == {"a": 3, "b": 2}
+    assert original == {"a": 1, "b": 2}
+
+
+def test_update_existing_keys_inplace():
+    original = {"a": 1, "b": 2}
+
+    rasa.utils.common.update_existing_keys_inplace(original, {"a": 3, "c": 4})
+
+    assert original == {"a": 3, "b": 2}
+
+
+def test_read_global_config_value_is_cached(tmp_path: Path, monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(
+        rasa.constants, "GLOBAL_USER_CONFIG_PATH", str(tmp_path / "global.yml")
+    )
+    assert rasa.utils.common.write_global_config_value("foo", {"bar": 1})
+
+    read_config_file = Mock(wraps=rasa.shared.utils.io.read_config_file)
+    monkeypatch.setattr(rasa.shared.utils.io, "read_config_file", read_config_file)
+
+    value = rasa.utils.common.read_global_config_value("foo")
+    value["bar"] = 2
+
+    assert rasa.utils.common.read_global_config_value("foo") == {"bar": 1}
+    read_config_file.assert_called_once()
+
+    assert rasa.utils.common.write_global_config_value("foo", {"bar": 3})
+    assert rasa.utils.common.read_global_config_value("foo") == {"bar": 3}
+
+
+def test_read_missing_global_config_value_is_cached(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(
+        rasa.constants, "GLOBAL_USER_CONFIG_PATH", str(tmp_path / "global.yml")
+    )
+    assert rasa.utils.common.write_global_config_value("foo", "bar")
+
+    read_config_file = Mock(wraps=rasa.shared.utils.io.read_config_file)
+    monkeypatch.setattr(rasa.shared.utils.io, "read_config_file", read_config_file)
+
+    for _ in range(3):
+        assert rasa.utils.common.read_global_config_value("missing") is None
+    with pytest.raises(ValueError):
+        rasa.utils.common.read_global_config_value("missing", unavailable_ok=False)
+
+    read_config_file.assert_called_once()
+
+
+@pytest.fixture
+def restore_log_levels() -> Generator[None, None, None]:
+    """Restores level and propagation of the loggers `set_log_level` changes."""
+    loggers = [
+        logging.getLogger(name)
+        for name in (
+            ("rasa",)
+            + rasa.utils.common.NON_PROPAGATING_LIBRARY_LOGGERS
+            + rasa.utils.common.ASYNCIO_LOGGERS
+            + rasa.utils.common.MATPLOTLIB_LOGGERS
+        )
+    ]
+    original_settings = [(logger.level, logger.propagate) for logger in loggers]
+    # tests may patch `setLevel`
+    set_level = logging.Logger.setLevel
+
+    yield
+
+    for logger, (level, propagate) in zip(loggers, original_settings):
+        set_level(logger, level)
+        logger.propagate = propagate
+
+
+@pytest.mark.usefixtures("restore_log_levels")
+def test_set_log_level_configures_library_loggers(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_LOG_LEVEL, "INFO")
+    monkeypatch.setenv(rasa.constants.ENV_LOG_LEVEL_LIBRARIES, "WARNING")
+    logging.getLogger("apscheduler").propagate = True
+
+    rasa.utils.common.set_log_level(logging.DEBUG)
+
+    assert logging.getLogger("rasa").level == logging.DEBUG
+    assert logging.getLogger("apscheduler").level == logging.WARNING
+    assert logging.getLogger("apscheduler").propagate is False
+    assert logging.getLogger("asyncio").level == logging.WARNING
+
+    # loggers which are already configured aren't touched again
+    set_level = Mock()
+    monkeypatch.setattr(logging.Logger, "setLevel", set_level)
+    rasa.utils.common.set_log_level(logging.DEBUG)
+    set_level.assert_not_called()
+
+
+@pytest.mark.usefixtures("restore_log_levels")
+def test_set_log_level_from_environment(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_LOG_LEVEL, "WARN")
+
+    rasa.utils.common.set_log_level()
+
+    assert logging.getLogger("rasa").level == logging.WARNING
+    assert os.environ[ENV_LOG_LEVEL] == "WARN"
+
+
+def test_run_in_loop_awaits_background_tasks():
+    finished = []
+
+    async def background_task() -> None:
+        await asyncio.sleep(0.01)
+        finished.append(True)
+
+    async def my_function() -> int:
+        asyncio.ensure_future(background_task())
+        return 5
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert rasa.utils.common.run_in_loop(my_function(), loop) == 5
+    finally:
+        loop.close()
+
+    assert finished == [True]